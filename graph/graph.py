@@ -19,6 +19,8 @@ def init_matplotlib(args):
         matplotlib.use(args.engine)
     except ValueError:
         fatal(f"Cannot load matplotlib backend engine {args.engine}")
+    # Graphs are only saved to files, never shown
+    plt.ioff()
 
 
 GRAPH_TYPES = ["perf", "perf_watt", "watts", "cpu_clock"]
@@ -1,17 +1,28 @@
 #!/usr/bin/env python3
 import argparse
+import os
 import pathlib
 import re
 import sys
 from typing import Any  # noqa: F401
 
+
+def missing_dependencies(exc: ImportError):
+    """Report a missing dependency and exit 1."""
+    print(exc)
+    print(
+        'Could not start hwgraph: did you make sure to also install the "graph" optional dependencies using `uv sync --extra graph` or `pip install hwbench[graph]`?'
+    )
+    sys.exit(1)
+
+
+# The rendering modules (graph.graph, graph.chassis, graph.individual, graph.scaling)
+# pull matplotlib & numpy, and the process pool pulls multiprocessing:
+# they are only imported when rendering so that quick invocations
+# like `list` or `--help` are not paying for it.
 try:
-    from graph.chassis import graph_chassis
     from graph.common import fatal
-    from graph.graph import generic_graph, init_matplotlib, yerr_graph
-    from graph.individual import individual_graph
-    from graph.scaling import scaling_graph
-    from graph.trace import Trace
+    from graph.trace import Bench, Trace
     from hwbench.bench.monitoring_structs import (
         FanContext,
         Metrics,
@@ -19,17 +30,28 @@ try:
         PowerContext,
     )
 except ImportError as exc:
-    print(exc)
-    print(
-        'Could not start hwgraph: did you make sure to also install the "graph" optional dependencies using `uv sync --extra graph` or `pip install hwbench[graph]`?'
-    )
-    sys.exit(1)
+    missing_dependencies(exc)
+
+# Compiled once, as the trace syntax is checked for every --traces argument
+TRACE_SYNTAX = re.compile(r"(?P<filename>.*):(?P<logical_name>.*):(?P<power_metric>.*)")
+
+# The second axis of the environmental graphs, None renders a graph without it
+SECOND_AXES = (None, Metrics.THERMAL, Metrics.POWER_CONSUMPTION)
+# The fans speed graphs are only rendered with a second axis
+FANS_SECOND_AXES = (Metrics.THERMAL, Metrics.POWER_CONSUMPTION)
+# (graph_name, metric, filter) of the cpu & pdu graphs
+CPU_GRAPHS = (
+    ("CPU Core power consumption", Metrics.POWER_CONSUMPTION, "Core"),
+    ("Package power consumption", Metrics.POWER_CONSUMPTION, "package"),
+    ("Core frequency", Metrics.FREQ, "Core"),
+)
+PDU_GRAPHS = (("PDU power reporting", Metrics.POWER_CONSUMPTION, "PDU"),)
 
 
 def valid_trace_file(trace_arg: str) -> Trace:
     """Custom argparse type to decode and validate the trace files"""
 
-    match = re.search(r"(?P<filename>.*):(?P<logical_name>.*):(?P<power_metric>.*)", trace_arg)
+    match = TRACE_SYNTAX.match(trace_arg)
     if not match:
         raise argparse.ArgumentTypeError(f"{trace_arg} does not match 'filename:logical_name:power_metric' syntax")
 
@@ -55,17 +77,51 @@ def list_metrics_in_trace(args: argparse.Namespace):
 
 def render_traces(args: argparse.Namespace):
     """Render the trace files passed in arguments"""
-    rendered_graphs = 0
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        from graph.graph import init_matplotlib
+    except ImportError as exc:
+        missing_dependencies(exc)
+
     init_matplotlib(args)
     output_dir = pathlib.Path(args.outdir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     compare_traces(args)
-    rendered_graphs += graph_environment(args, output_dir)
-    rendered_graphs += plot_graphs(args, output_dir)
+    render_jobs = graph_environment(args, output_dir)
+    render_jobs += plot_graphs(args, output_dir)
+
+    rendered_graphs = 0
+    if render_jobs:
+        # Render jobs are not sharing any figure, let's spread them over the cpus
+        # but never start more workers than there are jobs to render.
+        max_workers = min(len(render_jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=init_render_worker, initargs=(args,)) as executor:
+            rendered_graphs = sum(executor.map(render_job, render_jobs))
     print(f"{rendered_graphs} graphs can be found in '{output_dir}' directory")
 
 
+# The arguments of the current render worker, set by init_render_worker()
+worker_args = None  # type: argparse.Namespace | None
+
+
+def init_render_worker(args: argparse.Namespace):
+    """Prepare a worker process to render graphs"""
+    global worker_args
+    from graph.graph import init_matplotlib
+
+    # The arguments, and so the traces, are only sent once per worker
+    worker_args = args
+    init_matplotlib(args)
+
+
+def render_job(job: tuple) -> int:
+    """Render a (graph_function, *parameters) job in a worker process"""
+    graph_function, *parameters = job
+    return graph_function(worker_args, *parameters)
+
+
 def compare_traces(args) -> None:
     """Check if benchmark definition are similar."""
     # To ensure a fair comparison, jobs must come from the same configuration file
@@ -73,29 +129,31 @@ def compare_traces(args) -> None:
     # To determine if traces can be compared, we'll compare only
     # the original configuration files, not the actual jobs.
 
-    names = []
+    names = set()
+    reference_config = args.traces[0].get_original_config()
     for trace in args.traces:
         # Is the current trace config file matches the first trace ?
-        if args.traces[0].get_original_config() != trace.get_original_config():
+        if reference_config != trace.get_original_config():
             # If a trace is not having the same configuration file,
             # It's impossible to compare & graph the results.
             fatal(f"{trace.filename} is not having the same configuration file as previous traces")
-        if trace.get_name() in names:
-            fatal(f"{trace.filename} is using '{trace.get_name()}' as logical_name while it's already in use")
-        else:
-            names.append(trace.get_name())
+        name = trace.get_name()
+        if name in names:
+            fatal(f"{trace.filename} is using '{name}' as logical_name while it's already in use")
+        names.add(name)
+
 
+def graph_monitoring_metrics(args, bench: Bench, output_dir) -> int:
+    from graph.graph import yerr_graph
 
-def graph_monitoring_metrics(args, trace: Trace, bench_name: str, output_dir) -> int:
     rendered_graphs = 0
-    bench = trace.bench(bench_name)
     for metric_name in ["BMC", "CPU", "PDU"]:
         metrics = bench.get_component(Metrics.MONITOR, metric_name)
         if metrics:
             for metric in metrics:
                 # If a metric has no measure, let's ignore it
                 if len(metrics[metric].get_samples()) == 0:
-                    print(f"{bench_name}: No samples found in {metric_name}.{metric}, ignoring metric.")
+                    print(f"{bench.get_bench_name()}: No samples found in {metric_name}.{metric}, ignoring metric.")
                 else:
                     rendered_graphs += yerr_graph(
                         args,
@@ -109,14 +167,15 @@ def graph_monitoring_metrics(args, trace: Trace, bench_name: str, output_dir) ->
     return rendered_graphs
 
 
-def graph_fans(args, trace: Trace, bench_name: str, output_dir) -> int:
+def graph_fans(args, bench: Bench, output_dir) -> int:
+    from graph.graph import generic_graph, yerr_graph
+
     rendered_graphs = 0
-    bench = trace.bench(bench_name)
     fans = bench.get_component(Metrics.FANS, FanContext.FAN)
     if not fans:
-        print(f"{bench_name}: no fans")
+        print(f"{bench.get_bench_name()}: no fans")
         return rendered_graphs
-    for second_axis in [Metrics.THERMAL, Metrics.POWER_CONSUMPTION]:
+    for second_axis in FANS_SECOND_AXES:
         rendered_graphs += generic_graph(args, output_dir, bench, Metrics.FANS, "Fans speed", second_axis)
 
     for fan in fans:
@@ -125,129 +184,144 @@ def graph_fans(args, trace: Trace, bench_name: str, output_dir) -> int:
     return rendered_graphs
 
 
-def graph_cpu(args, trace: Trace, bench_name: str, output_dir) -> int:
+def graph_cpu(args, bench: Bench, output_dir) -> int:
+    from graph.graph import generic_graph
+
     rendered_graphs = 0
-    bench = trace.bench(bench_name)
-    cpu_graphs = {}
-    cpu_graphs["CPU Core power consumption"] = {Metrics.POWER_CONSUMPTION: "Core"}
-    cpu_graphs["Package power consumption"] = {Metrics.POWER_CONSUMPTION: "package"}
-    cpu_graphs["Core frequency"] = {Metrics.FREQ: "Core"}
-    for graph_name in cpu_graphs:
+    for graph_name, metric, filter in CPU_GRAPHS:
         # Let's render the performance, perf_per_temp, perf_per_watt graphs
-        for metric, filter in cpu_graphs[graph_name].items():
-            for second_axis in [None, Metrics.THERMAL, Metrics.POWER_CONSUMPTION]:
-                rendered_graphs += generic_graph(
-                    args,
-                    output_dir,
-                    bench,
-                    metric,
-                    graph_name,
-                    second_axis,
-                    filter=filter,
-                )
+        for second_axis in SECOND_AXES:
+            rendered_graphs += generic_graph(
+                args,
+                output_dir,
+                bench,
+                metric,
+                graph_name,
+                second_axis,
+                filter=filter,
+            )
 
     return rendered_graphs
 
 
-def graph_pdu(args, trace: Trace, bench_name: str, output_dir) -> int:
+def graph_pdu(args, bench: Bench, output_dir) -> int:
+    from graph.graph import generic_graph
+
     rendered_graphs = 0
-    bench = trace.bench(bench_name)
-    pdu_graphs = {}
-    pdu_graphs["PDU power reporting"] = {Metrics.POWER_CONSUMPTION: "PDU"}
-    for graph_name in pdu_graphs:
+    for graph_name, metric, filter in PDU_GRAPHS:
         # Let's render the performance, perf_per_temp, perf_per_watt graphs
-        for metric, filter in pdu_graphs[graph_name].items():
-            for second_axis in [None, Metrics.THERMAL, Metrics.POWER_CONSUMPTION]:
-                rendered_graphs += generic_graph(
-                    args,
-                    output_dir,
-                    bench,
-                    metric,
-                    graph_name,
-                    second_axis,
-                    filter=filter,
-                )
+        for second_axis in SECOND_AXES:
+            rendered_graphs += generic_graph(
+                args,
+                output_dir,
+                bench,
+                metric,
+                graph_name,
+                second_axis,
+                filter=filter,
+            )
 
     return rendered_graphs
 
 
-def graph_thermal(args, trace: Trace, bench_name: str, output_dir) -> int:
+def graph_thermal(args, bench: Bench, output_dir) -> int:
+    from graph.graph import generic_graph
+
     rendered_graphs = 0
-    rendered_graphs += generic_graph(args, output_dir, trace.bench(bench_name), Metrics.THERMAL, str(Metrics.THERMAL))
+    rendered_graphs += generic_graph(args, output_dir, bench, Metrics.THERMAL, str(Metrics.THERMAL))
     return rendered_graphs
 
 
-def graph_environment(args, output_dir) -> int:
+def valid_traces(args) -> str:
+    """Return why the traces cannot be graphed as the same chassis, or an empty string."""
+    server = {trace.get_server_serial() for trace in args.traces}
+    # Let's ensure we don't have the same serial twice
+    if len(server) != len(args.traces):
+        return "environment: server are not unique, disabling same-chassis print"
+
+    # Let's ensure all traces has server and chassis metrics
+    for trace in args.traces:
+        first_bench = trace.first_bench()
+        for metric in [PowerCategories.CHASSIS, PowerCategories.SERVER]:
+            try:
+                first_bench.get_single_metric(Metrics.POWER_CONSUMPTION, PowerContext.BMC, metric)
+            except KeyError:
+                return f"environment: missing '{metric}' monitoric metric in {trace.get_filename()}, disabling same-enclosure print"
+    return ""
+
+
+def graph_bench_environment(args, trace_index: int, bench_name: str, output_dir) -> int:
+    """Render the environmental graphs of a bench"""
+    # The trace is given by index to avoid pickling it for every render job
+    # Loading a bench parses its monitoring metrics, let's do it once for all graphs
+    bench = args.traces[trace_index].bench(bench_name)
     rendered_graphs = 0
+    rendered_graphs += graph_monitoring_metrics(args, bench, output_dir)
+    rendered_graphs += graph_fans(args, bench, output_dir)
+    rendered_graphs += graph_cpu(args, bench, output_dir)
+    rendered_graphs += graph_pdu(args, bench, output_dir)
+    rendered_graphs += graph_thermal(args, bench, output_dir)
+    return rendered_graphs
+
+
+def graph_environment(args, output_dir) -> list[tuple]:
+    """Return the render jobs of the environmental graphs"""
+    from graph.chassis import graph_chassis
+
+    render_jobs = []  # type: list[tuple]
     # If user disabled the environmental graphs, return immediately
-    if not args.no_env:
+    if not args.env:
         print("environment: disabled by user")
-        return rendered_graphs
+        return render_jobs
 
     chassis = args.traces[0].get_chassis_serial()
-    if chassis:
-        all_chassis = [t.get_chassis_serial() == chassis for t in args.traces]
-        # if all traces are from the same chassis, let's enable the same_chassis feature
-        if all_chassis.count(True) == len(args.traces) and len(args.traces) > 1:
-            print(f"environment: All traces are from the same chassis ({chassis}), enabling --same-chassis feature")
-            args.same_chassis = True
+    # if all traces are from the same chassis, let's enable the same_chassis feature
+    if chassis and len(args.traces) > 1 and all(t.get_chassis_serial() == chassis for t in args.traces):
+        print(f"environment: All traces are from the same chassis ({chassis}), enabling --same-chassis feature")
+        args.same_chassis = True
 
     if args.same_chassis:
-
-        def valid_traces(args):
-            server = [trace.get_server_serial() for trace in args.traces]
-            # Let's ensure we don't have the same serial twice
-
-            if len(server) == len(args.traces):
-                # Let's ensure all traces has server and chassis metrics
-                for trace in args.traces:
-                    try:
-                        for metric in [
-                            PowerCategories.CHASSIS,
-                            PowerCategories.SERVER,
-                        ]:
-                            trace.first_bench().get_single_metric(
-                                Metrics.POWER_CONSUMPTION,
-                                PowerContext.BMC,
-                                metric,
-                            )
-                    except KeyError:
-                        return f"environment: missing '{metric}' monitoric metric in {trace.get_filename()}, disabling same-enclosure print"
-            else:
-                return "environment: server are not unique, disabling same-chassis print"
-            return ""
-
         error_message = valid_traces(args)
         if not error_message:
-            for bench_name in sorted(args.traces[0].bench_list()):
-                rendered_graphs += graph_chassis(args, bench_name, output_dir)
+            for bench_name in args.traces[0].sorted_bench_list():
+                render_jobs.append((graph_chassis, bench_name, output_dir))
         else:
             print(error_message)
 
-    for trace in args.traces:
-        output_dir.joinpath(f"{trace.get_name()}").mkdir(parents=True, exist_ok=True)
-        benches = trace.bench_list()
-        print(f"environment: rendering {len(benches)} jobs from {trace.get_filename()} ({trace.get_name()})")
-        for bench_name in sorted(benches):
-            rendered_graphs += graph_monitoring_metrics(args, trace, bench_name, output_dir)
-            rendered_graphs += graph_fans(args, trace, bench_name, output_dir)
-            rendered_graphs += graph_cpu(args, trace, bench_name, output_dir)
-            rendered_graphs += graph_pdu(args, trace, bench_name, output_dir)
-            rendered_graphs += graph_thermal(args, trace, bench_name, output_dir)
-
-    return rendered_graphs
-
+    # Only create the trace directories that are missing from the output directory
+    # os.scandir() gets the entry types from the directory listing, without a stat() per entry
+    out_str = str(output_dir)
+    with os.scandir(out_str) as entries:
+        existing_dirs = {entry.name for entry in entries if entry.is_dir()}
+    for trace_index, trace in enumerate(args.traces):
+        trace_name = trace.get_name()
+        if trace_name not in existing_dirs:
+            os.makedirs(os.path.join(out_str, trace_name), exist_ok=True)
+            existing_dirs.add(trace_name)
+        benches = trace.sorted_bench_list()
+        print(f"environment: rendering {len(benches)} jobs from {trace.get_filename()} ({trace_name})")
+        for bench_name in benches:
+            render_jobs.append((graph_bench_environment, trace_index, bench_name, output_dir))
+
+    return render_jobs
+
+
+def plot_graphs(args, output_dir) -> list[tuple]:
+    """Return the render jobs of the scaling & individual graphs"""
+    from graph.individual import individual_graph
+    from graph.scaling import scaling_graph
 
-def plot_graphs(args, output_dir) -> int:
-    jobs = []
-    rendered_graphs = 0
-    for bench_name in sorted(args.traces[0].bench_list()):
-        job_name = args.traces[0].bench(bench_name).job_name()
-        # We want to keep a single job type
-        # i.e an avx test can be rampuped from 1 to 64 cores, generating tens of sub jobs
-        # We just want to keep the "avx" test as a reference, not all iterations
-        if job_name not in jobs:
-            jobs.append(job_name)
+    render_jobs = []  # type: list[tuple]
+    reference_trace = args.traces[0]
+    # We want to keep a single job type
+    # i.e an avx test can be rampuped from 1 to 64 cores, generating tens of sub jobs
+    # We just want to keep the "avx" test as a reference, not all iterations
+    # dict.fromkeys() keeps the first occurrence of each job, in order.
+    jobs = list(
+        dict.fromkeys(
+            reference_trace.bench(bench_name).job_name() for bench_name in reference_trace.sorted_bench_list()
+        )
+    )
 
     traces_name = [trace.get_name() for trace in args.traces]
 
@@ -257,7 +331,7 @@ def plot_graphs(args, output_dir) -> int:
         # Let's generate the scaling graphs
         print(f"Scaling: rendering {len(jobs)} jobs")
         for job in jobs:
-            rendered_graphs += scaling_graph(args, output_dir, job, traces_name)
+            render_jobs.append((scaling_graph, output_dir, job, traces_name))
 
     if not args.no_individual:
         print("Individual: disabled by user")
@@ -265,9 +339,9 @@ def plot_graphs(args, output_dir) -> int:
         # Let's generate the unitary comparing graphs
         print(f"Individual: rendering {len(jobs)} jobs")
         for job in jobs:
-            rendered_graphs += individual_graph(args, output_dir, job, traces_name)
+            render_jobs.append((individual_graph, output_dir, job, traces_name))
 
-    return rendered_graphs
+    return render_jobs
 
 
 def main():
@@ -294,7 +368,12 @@ power_metric : the name of a power metric, from the monitoring, to be used for '
 """,
         required=True,
     )
-    parser_graph.add_argument("--no-env", help="Disable environmental graphs", action="store_false")
+    parser_graph.add_argument(
+        "--env",
+        help="Enable or disable environmental graphs",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+    )
     parser_graph.add_argument("--no-scaling", help="Disable scaling graphs", action="store_false")
     parser_graph.add_argument("--no-individual", help="Disable individual graphs", action="store_false")
     parser_graph.add_argument("--title", help="Title of the graph")
@@ -312,7 +391,7 @@ power_metric : the name of a power metric, from the monitoring, to be used for '
         "--engine",
         help="Select the matplotlib backend engine",
         choices=["pgf", "svg", "agg", "cairo"],
-        default="cairo",
+        default="agg",
     )
     parser_graph.add_argument("--outdir", help="Name of the output directory", required=True)
     parser_graph.add_argument(
@@ -414,6 +414,9 @@ class Trace:
         except ValueError:
             raise ValueError(f"{self.filename} is not a valid JSON file")
 
+        # The benches are iterated in order many times, let's sort them once
+        self.sorted_benches = sorted(self.bench_list())
+
     def validate(self) -> None:
         # If no logical name was given, let's use the serial number as a default
         if not self.logical_name:
@@ -518,9 +521,13 @@ class Trace:
         """Return the list of benches"""
         return self.get_trace()["bench"]
 
+    def sorted_bench_list(self) -> list[str]:
+        """Return the sorted list of benches"""
+        return self.sorted_benches
+
     def first_bench(self) -> Bench:
         """Return the first bench"""
-        b = self.bench(next(iter(sorted(self.bench_list()))))
+        b = self.bench(self.sorted_bench_list()[0])
         b.load_monitoring()
         return b
 
@@ -61,6 +61,10 @@ class DmidecodeRaw(External):
         """Not much to parse since the full output is the version with dmidecode"""
         return stdout.strip()
 
+    def output_exists(self) -> bool:
+        """The actual output is the binary dump, not the command's stdout"""
+        return self.out_dir.joinpath("dmidecode.bin").exists()
+
     @property
     def name(self) -> str:
         return "dmidecode-bin"
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import pathlib
 from abc import abstractmethod
-
-from hwbench.utils.external import External_Simple
+from concurrent.futures import ThreadPoolExecutor
 
 from .base import BaseEnvironment
 from .cpu import CPU
 from .dmi import DmidecodeRaw, DmiSys
+from .ipmitool import IpmitoolSdr
 from .lspci import Lspci, LspciBin
 from .vendors.detect import first_matching_vendor
 from .vendors.vendor import Vendor
@@ -38,16 +38,29 @@ class BaseHardware(BaseEnvironment):
 
 
 class Hardware(BaseHardware):
-    def __init__(self, out_dir: pathlib.Path, monitoring_config):
+    def __init__(self, out_dir: pathlib.Path, monitoring_config, force_refresh=False):
         super().__init__(out_dir)
         self.dmi = DmiSys(out_dir)
         self.vendor = first_matching_vendor(out_dir, self.dmi, monitoring_config)
-        self.vendor.save_bios_config()
-        self.vendor.save_bmc_config()
-        Lspci(out_dir).run()
-        LspciBin(out_dir).run()
-        DmidecodeRaw(out_dir).run()
-        External_Simple(self.out_dir, ["ipmitool", "sdr"], "ipmitool-sdr")
+        # Unless a refresh is forced, the outputs already saved by a previous run are kept.
+        # lspci & dmidecode are local commands mostly waiting for their output,
+        # let's run them concurrently while the BMC related collectors run one after the other.
+        with ThreadPoolExecutor() as executor:
+            collectors = [
+                executor.submit(external.run)
+                for external in [Lspci(out_dir), LspciBin(out_dir), DmidecodeRaw(out_dir)]
+                if force_refresh or not external.output_exists()
+            ]
+            if force_refresh or not self.vendor.bios_config_saved():
+                self.vendor.save_bios_config()
+            if force_refresh or not self.vendor.bmc_config_saved():
+                self.vendor.save_bmc_config()
+            ipmitool_sdr = IpmitoolSdr(out_dir)
+            if force_refresh or not ipmitool_sdr.output_exists():
+                ipmitool_sdr.run()
+            for collector in collectors:
+                # Raises the collector's exception, if any
+                collector.result()
 
     def dump(self) -> dict[str, str | int | None | dict]:
         dump = {
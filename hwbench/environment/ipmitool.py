@@ -0,0 +1,20 @@
+from hwbench.utils.external import External
+
+
+class IpmitoolSdr(External):
+    def run_cmd(self) -> list[str]:
+        """Dump the BMC sensors repository"""
+        return ["ipmitool", "sdr"]
+
+    def parse_cmd(self, stdout: bytes, _stderr: bytes):
+        return None
+
+    def run_cmd_version(self) -> list[str]:
+        return []
+
+    def parse_version(self, stdout: bytes, _stderr: bytes) -> bytes:
+        return b""
+
+    @property
+    def name(self) -> str:
+        return "ipmitool-sdr"
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pathlib
+import tempfile
+import unittest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from hwbench.utils.external import External
+
+from .hardware import Hardware
+from .vendors.amd.amd import Amd
+from .vendors.hpe.hpe import Hpe
+from .vendors.mock import MockVendor
+from .vendors.vendor import Vendor
+
+# The outputs left by a previous run in the output directory
+PREVIOUS_OUTPUTS = [
+    "lspci-verbose-stdout",
+    "lspci-bin-stdout",
+    "dmidecode.bin",
+    "ipmitool-sdr-stdout",
+    "mock-bios-config",
+    "mock-bmc-config",
+]
+
+
+class TestHardware(unittest.TestCase):
+    def collect(
+        self, out_dir: pathlib.Path, force_refresh=False, vendor: Vendor | None = None
+    ) -> tuple[list[str], list[str]]:
+        """Create a Hardware object, return the commands it ran and the vendor configurations it saved."""
+        commands = []
+        saved = []
+        hardware = "hwbench.environment.hardware"
+        if not vendor:
+            vendor = MockVendor(out_dir, None)
+        with ExitStack() as stack:
+            stack.enter_context(patch(f"{hardware}.CPU"))
+            stack.enter_context(patch(f"{hardware}.DmiSys"))
+            stack.enter_context(patch(f"{hardware}.first_matching_vendor", return_value=vendor))
+            stack.enter_context(
+                patch.object(External, "run", autospec=True, side_effect=lambda e: commands.append(e.name))
+            )
+            stack.enter_context(patch.object(MockVendor, "save_bios_config", side_effect=lambda: saved.append("bios")))
+            stack.enter_context(patch.object(MockVendor, "save_bmc_config", side_effect=lambda: saved.append("bmc")))
+            Hardware(out_dir, None, force_refresh)
+        return sorted(commands), saved
+
+    def test_collect(self):
+        """Check every collector runs on an empty output directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            commands, saved = self.collect(pathlib.Path(tmpdir))
+            assert commands == ["dmidecode-bin", "ipmitool-sdr", "lspci-bin", "lspci-verbose"]
+            assert saved == ["bios", "bmc"]
+
+    def test_skip_previous_outputs(self):
+        """Check the outputs of a previous run are kept, unless a refresh is forced."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = pathlib.Path(tmpdir)
+            for output in PREVIOUS_OUTPUTS:
+                out_dir.joinpath(output).write_text("")
+            commands, saved = self.collect(out_dir)
+            assert commands == []
+            assert saved == []
+
+            commands, saved = self.collect(out_dir, force_refresh=True)
+            assert commands == ["dmidecode-bin", "ipmitool-sdr", "lspci-bin", "lspci-verbose"]
+            assert saved == ["bios", "bmc"]
+
+    def test_failed_vendor_outputs(self):
+        """Check the vendor configurations are saved again when a previous run failed to."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = pathlib.Path(tmpdir)
+            for output in PREVIOUS_OUTPUTS:
+                out_dir.joinpath(output).write_text("")
+
+            # The AMI tool ran but didn't write the bios-config file
+            out_dir.joinpath("ami-aptio-bios-stdout").write_text("Error: unable to read the BIOS settings")
+            commands, _ = self.collect(out_dir, vendor=Amd(out_dir, None, None))
+            assert commands == ["ami-aptio-bios"]
+            out_dir.joinpath("bios-config").write_text("")
+            commands, _ = self.collect(out_dir, vendor=Amd(out_dir, None, None))
+            assert commands == []
+
+            # ilorest printed an error instead of the BIOS settings, and didn't clone the server
+            out_dir.joinpath("ilorest-bios-stdout").write_text("Error: no session available")
+            out_dir.joinpath("ilorest-serverclone-stdout").write_text("")
+            commands, _ = self.collect(out_dir, vendor=Hpe(out_dir, None, None))
+            assert commands == ["ilorest-bios", "ilorest-serverclone"]
+            out_dir.joinpath("ilorest-bios-stdout").write_text('{"Bios": {}}')
+            out_dir.joinpath("ilorest_clone.json").write_text("{}")
+            commands, _ = self.collect(out_dir, vendor=Hpe(out_dir, None, None))
+            assert commands == []
@@ -13,5 +13,8 @@ class Amd(Vendor):
     def save_bmc_config(self):
         return
 
+    def bios_config_saved(self) -> bool:
+        return Ami_Aptio(self.out_dir).output_exists()
+
     def name(self) -> str:
         return "AMD Corporation"
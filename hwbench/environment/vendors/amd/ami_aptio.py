@@ -31,6 +31,10 @@ class Ami_Aptio(External):
                 break
         return self.version
 
+    def output_exists(self) -> bool:
+        """The actual output is the bios-config file, not the command's stdout"""
+        return self.out_dir.joinpath("bios-config").exists()
+
     @property
     def name(self) -> str:
         return "ami-aptio-bios"
@@ -26,5 +26,11 @@ class GenericVendor(Vendor):
         # different vendors also have different Oem "backup" systems
         self.out_dir.joinpath("generic-bmc-config").write_text("")
 
+    def bios_config_saved(self) -> bool:
+        return self.out_dir.joinpath("generic-bios-config").exists()
+
+    def bmc_config_saved(self) -> bool:
+        return self.out_dir.joinpath("generic-bmc-config").exists()
+
     def name(self) -> str:
         return "GenericVendor"
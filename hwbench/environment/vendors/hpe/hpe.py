@@ -193,6 +193,12 @@ class Hpe(Vendor):
     def save_bmc_config(self):
         IlorestServerclone(self.out_dir).run()
 
+    def bios_config_saved(self) -> bool:
+        return Ilorest(self.out_dir).output_exists()
+
+    def bmc_config_saved(self) -> bool:
+        return IlorestServerclone(self.out_dir).output_exists()
+
     def name(self) -> str:
         return "HPE"
 
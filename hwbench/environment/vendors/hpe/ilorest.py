@@ -22,6 +22,18 @@ class Ilorest(External):
         self.version = stdout.split()[3]
         return self.version
 
+    def output_exists(self) -> bool:
+        """Returns True if a previous run already saved the BIOS settings"""
+        # stdout is saved before being parsed, a failed dump leaves an error message instead of json
+        stdout = self.out_dir.joinpath(f"{self.name}-stdout")
+        if not stdout.exists():
+            return False
+        try:
+            json.loads(stdout.read_bytes())
+        except ValueError:
+            return False
+        return True
+
     @property
     def name(self) -> str:
         return "ilorest-bios"
@@ -42,6 +54,10 @@ class IlorestServerclone(External):
         self.version = stdout.split()[3]
         return self.version
 
+    def output_exists(self) -> bool:
+        """The actual output is the clone file, not the command's stdout"""
+        return self.out_dir.joinpath("ilorest_clone.json").exists()
+
     @property
     def name(self) -> str:
         return "ilorest-serverclone"
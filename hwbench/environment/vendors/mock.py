@@ -111,6 +111,12 @@ class MockVendor(Vendor):
     def save_bmc_config(self):
         self.out_dir.joinpath("mock-bmc-config").write_text("")
 
+    def bios_config_saved(self) -> bool:
+        return self.out_dir.joinpath("mock-bios-config").exists()
+
+    def bmc_config_saved(self) -> bool:
+        return self.out_dir.joinpath("mock-bmc-config").exists()
+
     def name(self) -> str:
         return "MockVendor"
 
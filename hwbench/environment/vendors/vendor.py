@@ -30,6 +30,14 @@ class Vendor(ABC):
     def save_bmc_config(self):
         pass
 
+    def bios_config_saved(self) -> bool:
+        """Return True if the BIOS configuration is already saved in out_dir."""
+        return False
+
+    def bmc_config_saved(self) -> bool:
+        """Return True if the BMC configuration is already saved in out_dir."""
+        return False
+
     @abstractmethod
     def name(self) -> str:
         pass
@@ -10,6 +10,12 @@ import time
 
 from packaging.version import Version
 
+try:
+    # orjson is an optional, faster, JSON encoder
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from .bench import benchmarks
 from .bench.monitoring_structs import MonitorMetric
 from .config import config
@@ -32,14 +38,14 @@ def main():
     if not is_root():
         h.fatal("hwbench is not running as effective uid 0.")
 
-    out_dir, tuning_out_dir = create_output_directory(args.output_directory)
+    out_dir, tuning_out_dir = create_output_directory(args.output_directory, args.force_refresh)
 
     # configure logging
     init_logging(tuning_out_dir / "hwbench-tuning.log")
 
     tuning_setup.Tuning(tuning_out_dir).apply(args.tuning)
     env = env_soft.Environment(out_dir)
-    hw = env_hw.Hardware(out_dir, args.monitoring_config)
+    hw = env_hw.Hardware(out_dir, args.monitoring_config, args.force_refresh)
 
     benches = benchmarks.Benchmarks(out_dir, config.Config(args.jobs_config, hw), hw)
     benches.parse_jobs_config()
@@ -57,13 +63,23 @@ def is_root():
     return os.geteuid() == 0
 
 
-def create_output_directory(directory) -> tuple[pathlib.Path, pathlib.Path]:
+def create_output_directory(directory, force_refresh=False) -> tuple[pathlib.Path, pathlib.Path]:
     out_dir = pathlib.Path(directory or f"hwbench-out-{time.strftime('%Y%m%d%H%M%S')}")
     if out_dir.exists():
-        h.fatal(f"Directory {out_dir} already exists, please give a non-existent directory.")
-    out_dir.mkdir()
+        if not out_dir.is_dir():
+            h.fatal(f"{out_dir} already exists and is not a directory.")
+        # Only an unfinished run can be resumed, never overwrite the results of a completed one
+        if (out_dir / "results.json").exists():
+            h.fatal(
+                f"Directory {out_dir} already contains the results of a completed run, please give another directory."
+            )
+        print(f"Warning: reusing directory {out_dir}, the outputs of the previous run will be overwritten.")
+        if force_refresh:
+            print("The hardware information will be collected again as requested by --force-refresh.")
+        else:
+            print("The hardware information it already contains will be kept, use --force-refresh to collect it again.")
     tuning_out_dir = out_dir / "tuning"
-    tuning_out_dir.mkdir()
+    tuning_out_dir.mkdir(parents=True, exist_ok=True)
 
     return out_dir.absolute(), tuning_out_dir.absolute()
 
@@ -88,7 +104,7 @@ def parse_options():
     parser.add_argument(
         "-o",
         "--output-directory",
-        help="Specify the directory used to put all results and collected information",
+        help="Specify the directory used to put all results and collected information, an existing directory is reused",
     )
     parser.add_argument(
         "--tuning",
@@ -96,6 +112,11 @@ def parse_options():
         default=True,
         help="Enable or disable tuning: this is useful when you want to test the system as-is.",
     )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Collect the hardware information again, even if the output directory already contains it.",
+    )
     return parser.parse_args()
 
 
@@ -124,7 +145,18 @@ class EnhancedJSONEncoder(json.JSONEncoder):
 def write_output(out_dir: pathlib.Path, out):
     out_file = out_dir / "results.json"
     print(f"Result file available at {out_file!s}")
-    out_file.write_text(json.dumps(out, cls=EnhancedJSONEncoder))
+    if orjson:
+        # orjson natively encodes dataclasses, but MonitorMetric needs our own encoding.
+        # Unlike json, which writes NaN & Infinity, orjson writes non-finite floats as null.
+        out_file.write_bytes(
+            orjson.dumps(
+                out,
+                default=EnhancedJSONEncoder().default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+    else:
+        out_file.write_text(json.dumps(out, cls=EnhancedJSONEncoder))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+import pathlib
+import tempfile
+import unittest
+
+import pytest
+
+from hwbench.hwbench import create_output_directory
+
+
+class TestOutputDirectory(unittest.TestCase):
+    def test_create(self):
+        """Check a new output directory is created, and reused if unfinished."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = pathlib.Path(tmpdir) / "out"
+            assert create_output_directory(out_dir) == (out_dir, out_dir / "tuning")
+            assert create_output_directory(out_dir, force_refresh=True) == (out_dir, out_dir / "tuning")
+
+    def test_refuse(self):
+        """Check a file or the directory of a completed run are refused."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_file = pathlib.Path(tmpdir) / "file"
+            out_file.write_text("")
+            with pytest.raises(SystemExit):
+                create_output_directory(out_file)
+
+            (pathlib.Path(tmpdir) / "results.json").write_text("{}")
+            with pytest.raises(SystemExit):
+                create_output_directory(tmpdir)
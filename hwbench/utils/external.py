@@ -37,6 +37,11 @@ class External(ABC):
         if len(content) > 0:
             self.out_dir.joinpath(f"{self.name}-{name}").write_bytes(content)
 
+    def output_exists(self) -> bool:
+        """Returns True if a previous run already saved the command output"""
+        # A previous run only saving stderr has most likely failed, so it doesn't count
+        return self.out_dir.joinpath(f"{self.name}-stdout").exists()
+
     def run(self):
         """Returns the output of parse_cmd (a json-able type)"""
         english_env = os.environ.copy()
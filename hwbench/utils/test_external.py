@@ -0,0 +1,20 @@
+import pathlib
+import tempfile
+import unittest
+
+from .external import External_Simple
+
+
+class TestExternal(unittest.TestCase):
+    def test_output_exists(self):
+        """Check the outputs of a previous run are detected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_dir = pathlib.Path(tmpdir)
+            external = External_Simple(out_dir, ["true"], "simple")
+            # 'true' is not printing anything, so no output is saved
+            assert not external.output_exists()
+            # A run only printing on stderr is considered as failed
+            External_Simple(out_dir, ["sh", "-c", "echo oops >&2"], "simple")
+            assert not external.output_exists()
+            External_Simple(out_dir, ["echo", "hello"], "simple")
+            assert external.output_exists()